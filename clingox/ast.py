@@ -106,9 +106,9 @@ Another interesting feature is to convert ASTs to YAML:
 '''
 
 from typing import Any, Callable, cast, List, Mapping, Optional, Set, Tuple, Union
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from copy import copy
-from re import fullmatch
+from re import compile as re_compile
 from enum import Enum, auto
 
 import clingo
@@ -170,23 +170,27 @@ def location_to_str(loc: Location) -> str:
     -------
     The string representation of the given location.
     """
-    begin, end = loc.begin, loc.end
-    bf, ef = _quote(begin.filename), _quote(end.filename)
-    ret = "{}:{}:{}".format(bf, begin.line, begin.column)
+    (bf, bl, bc), (ef, el, ec) = loc
+    bf, ef = _quote(bf), _quote(ef)
+    ret = "{}:{}:{}".format(bf, bl, bc)
     dash, eq = True, bf == ef
     if not eq:
         ret += "{}{}".format("-" if dash else ":", ef)
         dash = False
-    eq = eq and begin.line == end.line
+    eq = eq and bl == el
     if not eq:
-        ret += "{}{}".format("-" if dash else ":", end.line)
+        ret += "{}{}".format("-" if dash else ":", el)
         dash = False
-    eq = eq and begin.column == end.column
+    eq = eq and bc == ec
     if not eq:
-        ret += "{}{}".format("-" if dash else ":", end.column)
+        ret += "{}{}".format("-" if dash else ":", ec)
         dash = False
     return ret
 
+_LOCATION_RE = re_compile(
+    r'(?P<bf>([^\\:]|\\\\|\\:)*):(?P<bl>[0-9]*):(?P<bc>[0-9]+)'
+    r'(-(((?P<ef>([^\\:]|\\\\|\\:)*):)?(?P<el>[0-9]*):)?(?P<ec>[0-9]+))?')
+
 def str_to_location(loc: str) -> Location:
     """
     This function parses a location from its string representation.
@@ -204,9 +208,7 @@ def str_to_location(loc: str) -> Location:
     --------
     location_to_str
     """
-    m = fullmatch(
-        r'(?P<bf>([^\\:]|\\\\|\\:)*):(?P<bl>[0-9]*):(?P<bc>[0-9]+)'
-        r'(-(((?P<ef>([^\\:]|\\\\|\\:)*):)?(?P<el>[0-9]*):)?(?P<ec>[0-9]+))?', loc)
+    m = _LOCATION_RE.fullmatch(loc)
     if not m:
         raise RuntimeError('could not parse location')
     begin = Position(_unquote(m['bf']), int(m['bl']), int(m['bc']))
@@ -232,14 +234,16 @@ class TheoryUnparsedTermParser:
     ----------
     table
         Mapping of operator/arity pairs to priority/associativity pairs.
+
+    Notes
+    -----
+    The operator and term stacks are local to each call of
+    `TheoryUnparsedTermParser.parse`. Hence, an instance can be used by
+    multiple threads at the same time.
     """
-    _stack: List[Tuple[str, Arity]]
-    _terms: List[AST]
     _table: OperatorTable
 
     def __init__(self, table: OperatorTable):
-        self._stack = []
-        self._terms = []
         self._table = table
 
     def _priority_and_associativity(self, operator: str) -> Tuple[int, Associativity]:
@@ -254,31 +258,32 @@ class TheoryUnparsedTermParser:
         """
         return self._table[(operator, arity)][0]
 
-    def _check(self, operator: str) -> bool:
+    def _check(self, stack: List[Tuple[str, Arity]], operator: str) -> bool:
         """
         Returns true if the stack has to be reduced because of the precedence
         of the given binary operator is lower than the preceeding operator on
         the stack.
         """
-        if not self._stack:
+        if not stack:
             return False
         priority, associativity = self._priority_and_associativity(operator)
-        previous_priority = self._priority(*self._stack[-1])
+        previous_priority = self._priority(*stack[-1])
         return (previous_priority > priority or
                 (previous_priority == priority and associativity == Associativity.Left))
 
-    def _reduce(self) -> None:
+    @staticmethod
+    def _reduce(stack: List[Tuple[str, Arity]], terms: List[AST]) -> None:
         """
         Combines the last unary or binary term on the stack.
         """
-        b = self._terms.pop()
-        operator, arity = self._stack.pop()
+        b = terms.pop()
+        operator, arity = stack.pop()
         if arity == Arity.Unary:
-            self._terms.append(TheoryFunction(b.location, operator, [b]))
+            terms.append(TheoryFunction(b.location, operator, [b]))
         else:
-            a = self._terms.pop()
+            a = terms.pop()
             l = Location(a.location.begin, b.location.end)
-            self._terms.append(TheoryFunction(l, operator, [a, b]))
+            terms.append(TheoryFunction(l, operator, [a, b]))
 
     def check_operator(self, operator: str, arity: Arity, location: Location) -> None:
         """
@@ -311,28 +316,29 @@ class TheoryUnparsedTermParser:
         -------
         The rewritten AST.
         """
-        del self._stack[:]
-        del self._terms[:]
+        stack: List[Tuple[str, Arity]] = []
+        terms: List[AST] = []
 
         arity = Arity.Unary
+        location = x.location
 
         for element in x.elements:
             for operator in element.operators:
-                self.check_operator(operator, arity, x.location)
+                self.check_operator(operator, arity, location)
 
-                while arity == Arity.Binary and self._check(operator):
-                    self._reduce()
+                while arity == Arity.Binary and self._check(stack, operator):
+                    self._reduce(stack, terms)
 
-                self._stack.append((operator, arity))
+                stack.append((operator, arity))
                 arity = Arity.Unary
 
-            self._terms.append(element.term)
+            terms.append(element.term)
             arity = Arity.Binary
 
-        while self._stack:
-            self._reduce()
+        while stack:
+            self._reduce(stack, terms)
 
-        return self._terms[0]
+        return terms[0]
 
 class TheoryTermParser(Transformer):
     """
@@ -369,9 +375,10 @@ class TheoryTermParser(Transformer):
         The rewritten AST.
         """
         arity = None
-        if len(x.arguments) == 1:
+        num_args = len(x.arguments)
+        if num_args == 1:
             arity = Arity.Unary
-        if len(x.arguments) == 2:
+        if num_args == 2:
             arity = Arity.Binary
         if arity is not None and is_operator(x.name):
             self._parser.check_operator(x.name, arity, x.location)
@@ -406,6 +413,12 @@ class TheoryParser(Transformer):
     atoms
         Mapping from atom name/arity pairs to tuples defining the acceptable
         structure of the theory atom.
+
+    Notes
+    -----
+    The parser keeps track of the scope it is visiting in instance
+    attributes. Hence, an instance must not be used by multiple threads at
+    the same time.
     """
     # pylint: disable=invalid-name
     _table: Mapping[Tuple[str, int],
@@ -466,8 +479,9 @@ class TheoryParser(Transformer):
         ret = self._visit_body(x)
         try:
             self._reset(True, False, not x.body)
-            head = self(x.head)
-            if head is not x.head:
+            old = x.head
+            head = self(old)
+            if head is not old:
                 if ret is x:
                     ret = copy(ret)
                 ret.head = head
@@ -564,8 +578,9 @@ class TheoryParser(Transformer):
         -------
         The rewritten AST.
         """
-        name = x.term.name
-        arity = len(x.term.arguments)
+        term = x.term
+        name = term.name
+        arity = len(term.arguments)
         if (name, arity) not in self._table:
             raise RuntimeError(f"theory atom definiton not found: {location_to_str(x.location)}")
 
@@ -578,19 +593,21 @@ class TheoryParser(Transformer):
             raise RuntimeError(f"theory atom must be a directive: {location_to_str(x.location)}")
 
         x = copy(x)
-        x.term = element_parser(x.term)
+        x.term = element_parser(term)
         x.elements = element_parser.visit_sequence(x.elements)
 
-        if x.guard is not None:
+        guard = x.guard
+        if guard is not None:
             if guard_table is None:
                 raise RuntimeError(f"unexpected guard in theory atom: {location_to_str(x.location)}")
 
             guards, guard_parser = guard_table
-            if x.guard.operator_name not in guards:
+            if guard.operator_name not in guards:
                 raise RuntimeError(f"unexpected guard in theory atom: {location_to_str(x.location)}")
 
-            x.guard = copy(x.guard)
-            x.guard.term = guard_parser(x.guard.term)
+            guard = copy(guard)
+            guard.term = guard_parser(guard.term)
+            x.guard = guard
 
         return x
 
@@ -720,6 +737,10 @@ def prefix_symbolic_atoms(x: AST, prefix: str) -> AST:
     return rename_symbolic_atoms(x, lambda s: prefix + s)
 
 
+@lru_cache(maxsize=None)
+def _encode_ast_type(x: ASTType) -> str:
+    return str(x).replace('ASTType.', '')
+
 @singledispatch
 def _encode(x: Any) -> Any:
     assert False, f"unknown value to encode: {x}"
@@ -773,7 +794,7 @@ def ast_to_dict(x: AST) -> dict:
     --------
     dict_to_ast
     """
-    ret = {"ast_type": str(x.ast_type).replace('ASTType.', '')}
+    ret = {"ast_type": _encode_ast_type(x.ast_type)}
     for key, val in x.items():
         if key == 'location':
             assert isinstance(val, Location)
@@ -264,11 +264,13 @@ class SymbolicBackend:
         '''
         Map the given atoms to program literals with the given sign.
         '''
-        return (_add_sign(self.backend.add_atom(symbol), sign) for symbol in atoms)
+        add_atom = self.backend.add_atom
+        return (_add_sign(add_atom(symbol), sign) for symbol in atoms)
 
     def _add_wlits(self, weighted_symbols: Sequence[Tuple[Symbol, int]], sign: bool) -> Iterable[Tuple[int, int]]:
         '''
         Map the given weighted atoms to weighted program literals with the
         given sign.
         '''
-        return ((_add_sign(self.backend.add_atom(x), sign), w) for (x, w) in weighted_symbols)
+        add_atom = self.backend.add_atom
+        return ((_add_sign(add_atom(x), sign), w) for (x, w) in weighted_symbols)
@@ -43,7 +43,7 @@ b c a
 from typing import (Callable, Iterable, List, Mapping, MutableMapping, MutableSequence, NamedTuple, Optional, Sequence,
                     Tuple, TypeVar)
 from dataclasses import dataclass, field
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from itertools import chain
 from copy import copy
 
@@ -184,10 +184,11 @@ def _add_stms_to_backend(stms: Iterable[Statement], backend: Backend, mapping: O
     '''
     Remap the given statements returning a list with the result.
     '''
-    for stm in stms:
-        if mapping:
+    if mapping:
+        for stm in stms:
             add_to_backend(remap(stm, mapping), backend)
-        else:
+    else:
+        for stm in stms:
             add_to_backend(stm, backend)
 
 # ------------------------------------------------------------------------------
@@ -427,6 +428,7 @@ class Heuristic(NamedTuple):
     priority: Weight
     condition: Sequence[Literal]
 
+@lru_cache(maxsize=None)
 def _pretty_str_heuristic_type(type_):
     return str(type_).replace('HeuristicType.', '')
 
@@ -718,6 +720,8 @@ class Remapping:
     facts
         A list of facts each of which will receive a fresh program atom.
     '''
+    __slots__ = ('_backend', '_map')
+
     _backend: Backend
     _map: MutableMapping[Atom, Atom]
 
@@ -747,10 +751,10 @@ class Remapping:
         -------
         The remapped program atom.
         '''
-        if atom not in self._map:
-            self._map[atom] = self._backend.add_atom()
-
-        return self._map[atom]
+        ret = self._map.get(atom)
+        if ret is None:
+            ret = self._map[atom] = self._backend.add_atom()
+        return ret
 
 __pdoc__['Remapping.__call__'] = True
 
@@ -3,13 +3,14 @@ Simple tests for ast manipulation.
 """
 
 from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, cast
 
 from clingo import Function
 from clingo.ast import AST, ASTType, Location, Position, Transformer, parse_string
 from .. import ast
 from ..ast import (
-    Arity, Associativity, TheoryTermParser, TheoryParser, TheoryAtomType,
+    Arity, Associativity, TheoryTermParser, TheoryParser, TheoryAtomType, TheoryUnparsedTermParser,
     ast_to_dict, dict_to_ast, location_to_str, prefix_symbolic_atoms, str_to_location, theory_parser_from_definition)
 
 TERM_TABLE = {"t": {("-", Arity.Unary): (3, Associativity.NoAssociativity),
@@ -185,6 +186,17 @@ class TestAST(TestCase):
         self.assertEqual(parse_term("f(1+2)+3"), "+(f(+(1,2)),3)")
         self.assertRaises(RuntimeError, parse_term, "1++2")
 
+    def test_parse_term_shared(self):
+        '''
+        Test parsing of theory terms with a parser shared between threads.
+        '''
+        parser = TheoryUnparsedTermParser(TERM_TABLE["t"])
+        terms = ["1+2", "1+2+3", "1+2*3", "1**2**3", "-1+2"] * 20
+        unparsed = [theory_atom(f"&p {{{s}}}").elements[0].terms[0] for s in terms]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parsed = list(pool.map(lambda x: str(parser.parse(x)), unparsed))
+        self.assertEqual(parsed, [parse_term(s) for s in terms])
+
     def test_parse_atom(self):
         '''
         Test parsing of theory atoms.
@@ -209,6 +221,18 @@ class TestAST(TestCase):
         self.assertRaises(RuntimeError, parse_stm, "&r { } < 1+2+3 :- x.")
         self.assertRaises(RuntimeError, parse_stm, ":- &r { } < 1+2+3.")
 
+    def test_parse_rule_unchanged(self):
+        """
+        Test that rules are only copied if the parser rewrites them.
+        """
+        parser = TheoryParser(TERM_TABLE, ATOM_TABLE)
+        rule = last_stm("a :- b.")
+        self.assertIs(parser(rule), rule)
+        rule = last_stm("&p {1+2} :- b.")
+        ret = parser(rule)
+        self.assertIsNot(ret, rule)
+        self.assertEqual(str(ret), "&p { +(1,2) } :- b.")
+
     def test_parse_theory(self):
         """
         Test creating parsers from theory definitions.
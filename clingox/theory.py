@@ -33,6 +33,9 @@ Example
 ```
 '''
 
+from typing import Callable, Mapping
+from operator import add, floordiv, mod, mul, pow as pow_, sub
+
 from clingo import Symbol, Function, String, Tuple_, Number, SymbolType, TheoryTerm, TheoryTermType
 
 __all__ = ['evaluate', 'invert_symbol', 'is_operator', 'require_number', 'TermEvaluator']
@@ -105,6 +108,14 @@ def _unquote(s: str) -> str:
 
     return ''.join(ret)
 
+_BINARY_OPERATORS: Mapping[str, Callable[[int, int], int]] = {
+    "+": add,
+    "-": sub,
+    "*": mul,
+    "**": pow_,
+    "\\": mod,
+    "/": floordiv}
+
 
 class TermEvaluator:
     '''
@@ -132,22 +143,11 @@ class TermEvaluator:
         -------
         The evaluated operator in form of a symbol.
         '''
-        if op == "+":
-            return Number(require_number(lhs) + require_number(rhs))
-        if op == "-":
-            return Number(require_number(lhs) - require_number(rhs))
-        if op == "*":
-            return Number(require_number(lhs) * require_number(rhs))
-        if op == "**":
-            return Number(require_number(lhs) ** require_number(rhs))
-        if op == "\\":
-            if rhs == Number(0):
+        fun = _BINARY_OPERATORS.get(op)
+        if fun is not None:
+            if op in ("\\", "/") and rhs == Number(0):
                 raise ZeroDivisionError("division by zero")
-            return Number(require_number(lhs) % require_number(rhs))
-        if op == "/":
-            if rhs == Number(0):
-                raise ZeroDivisionError("division by zero")
-            return Number(require_number(lhs) // require_number(rhs))
+            return Number(fun(require_number(lhs), require_number(rhs)))
 
         if is_operator(op):
             raise AttributeError('unexpected operator')
@@ -224,6 +224,8 @@ class TermEvaluator:
 
 __pdoc__['TermEvaluator.__call__'] = True
 
+_EVALUATOR = TermEvaluator()
+
 def evaluate(term: TheoryTerm) -> Symbol:
     '''
     Evaluates the operators in a theory term in the same fashion as clingo
@@ -237,5 +239,10 @@ def evaluate(term: TheoryTerm) -> Symbol:
     Returns
     -------
     The evaluated term in form of a symbol.
+
+    Notes
+    -----
+    All calls share a single stateless `TermEvaluator`, so this function can
+    be called from multiple threads at the same time.
     '''
-    return TermEvaluator()(term)
+    return _EVALUATOR(term)